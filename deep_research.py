@@ -30,19 +30,29 @@ Get your Nyne.ai API keys at: https://nyne.ai
 """
 
 import argparse
+import atexit
+import functools
+import hashlib
+import itertools
 import json
 import os
+import pathlib
+import random
+import re
 import sys
+import tempfile
+import threading
 import time
 import warnings
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 # Suppress deprecation warning from google.generativeai
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=DeprecationWarning)
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 # Try to load dotenv, but don't fail if not installed
 try:
@@ -51,6 +61,35 @@ try:
 except ImportError:
     pass  # dotenv is optional
 
+# Try orjson for serializing the large research payloads (3-10x faster than
+# stdlib json on deeply nested dicts), but fall back to stdlib if not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj, indent: bool = True) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=str).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def _parse_response(response) -> Dict:
+    """
+    Parse a JSON response body. Nyne always returns UTF-8 JSON, so when
+    orjson is available we parse the raw bytes directly and skip requests'
+    content-type/encoding detection (which can invoke chardet on multi-MB
+    following lists).
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -61,14 +100,185 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 
+# LLM SDKs are imported once at startup (where the cost overlaps arg parsing
+# and env loading) rather than inside each call, and only when the matching
+# API key is set. A --json CLI run never touches an LLM, so it skips the
+# SDK imports and client construction entirely - they dominate cold start.
+# Batch mode is simulation mode and always needs an LLM, so its presence
+# disables the skip regardless of --json.
+# Each remains optional: a missing package just disables that provider.
+_LLM_NEEDED = not (__name__ == "__main__" and "--json" in sys.argv
+                   and "--batch" not in sys.argv)
+
+genai = None
+if GEMINI_API_KEY and _LLM_NEEDED:
+    try:
+        import google.generativeai as genai
+        genai.configure(api_key=GEMINI_API_KEY)
+    except ImportError:
+        genai = None
+
+OpenAI = None
+if OPENAI_API_KEY and _LLM_NEEDED:
+    try:
+        from openai import OpenAI
+    except ImportError:
+        OpenAI = None
+
+anthropic = None
+if ANTHROPIC_API_KEY and _LLM_NEEDED:
+    try:
+        import anthropic
+    except ImportError:
+        anthropic = None
+
+# Provider clients are built once and reused across calls - client
+# construction sets up TLS transports and auth state that would otherwise
+# be repeated for every batch in generate_dossier.
+_GEMINI_MODEL = genai.GenerativeModel(
+    'gemini-2.5-flash',
+    generation_config={"temperature": 0.7, "max_output_tokens": 65536}
+) if genai else None
+_OPENAI_CLIENT = OpenAI(api_key=OPENAI_API_KEY) if OpenAI else None
+_ANTHROPIC_CLIENT = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY) if anthropic else None
+
 NYNE_BASE_URL = "https://api.nyne.ai"
 
+# Compiled once at import - a malformed identifier fails here instead of
+# wasting a full Nyne submit + poll round-trip to find out server-side
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_LINKEDIN_RE = re.compile(r"^https?://([\w.]+\.)?linkedin\.com/in/[^/\s]+/?", re.IGNORECASE)
+
+# Shared HTTP session with connection pooling - keeps TCP+TLS connections to
+# api.nyne.ai alive across submits and poll loops instead of handshaking per call.
+# pool_maxsize >= ThreadPoolExecutor max_workers so concurrent pollers never block.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=True
+    )
+))
+
+# Process-wide worker pool shared by deep_research and generate_dossier.
+# Threads spawn once and are reused across calls - this matters when the
+# module is embedded in a long-running service that researches many people.
+# Every call site drains its own futures, so sharing one pool is safe.
+_EXECUTOR = ThreadPoolExecutor(max_workers=max(8, (os.cpu_count() or 4) * 2),
+                               thread_name_prefix="nyne")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+# Optional HTTP/2 upgrade: with httpx (and its h2 extra) installed, concurrent
+# pollers multiplex over one TLS connection instead of opening one per thread.
+# Falls back to the pooled requests Session when httpx isn't available.
+try:
+    import httpx
+    _HTTPX_CLIENT = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8),
+        timeout=30.0
+    )
+except Exception:
+    _HTTPX_CLIENT = None
+
+atexit.register(_SESSION.close)
+if _HTTPX_CLIENT is not None:
+    atexit.register(_HTTPX_CLIENT.close)
+
+
+# Transient statuses retried on the httpx transport - httpx has no built-in
+# status retries, so without this loop installing httpx[http2] would silently
+# drop the 429/5xx handling the requests session gets from urllib3's Retry
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_ATTEMPTS = 4
+
+
+def _send_with_retries(send):
+    """Call send() until a non-transient status arrives, honoring Retry-After."""
+    for attempt in range(_RETRY_ATTEMPTS):
+        response = send()
+        if response.status_code not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS - 1:
+            return response
+        try:
+            delay = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            delay = 0.3 * (2 ** attempt)
+        time.sleep(delay)
+    return response
+
+
+def _http_post(url: str, headers: Dict = None, json: Dict = None, timeout: float = 30):
+    """POST via the HTTP/2 client when available, else the pooled session."""
+    if _HTTPX_CLIENT is not None:
+        return _send_with_retries(
+            lambda: _HTTPX_CLIENT.post(url, headers=headers, json=json, timeout=timeout))
+    return _SESSION.post(url, headers=headers, json=json, timeout=timeout)
+
+
+def _http_get(url: str, headers: Dict = None, params: Dict = None, timeout: float = 30):
+    """GET via the HTTP/2 client when available, else the pooled session."""
+    if _HTTPX_CLIENT is not None:
+        return _send_with_retries(
+            lambda: _HTTPX_CLIENT.get(url, headers=headers, params=params, timeout=timeout))
+    return _SESSION.get(url, headers=headers, params=params, timeout=timeout)
+
 # Following cache file path (pre-fetched data)
 FOLLOWING_CACHE_FILE = "/Users/michaelfanous/deep_research_test/nyne-deep-research/following_cache.json"
 
 # Global cache (loaded once)
 _following_cache = None
 
+# On-disk cache for full research results - running the tool twice on the same
+# person should cost a disk read, not another 30-300s enrichment cycle.
+RESEARCH_CACHE_DIR = pathlib.Path.home() / ".cache" / "nyne_deep_research"
+RESEARCH_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+def _cache_key(*parts) -> str:
+    """Build a stable cache key from normalized identifier parts."""
+    normalized = "|".join((p or "").lower().strip() for p in parts)
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+def set_cache_ttl(hours: float):
+    """Set the research and LLM cache lifetime (CLI: --cache-ttl)."""
+    global RESEARCH_CACHE_TTL, _LLM_CACHE_TTL
+    RESEARCH_CACHE_TTL = _LLM_CACHE_TTL = hours * 60 * 60
+
+
+def _cache_get(key: str, ttl: Optional[int] = None) -> Optional[Dict]:
+    """Read a cached JSON payload. Returns None on miss, expiry, or corruption."""
+    path = RESEARCH_CACHE_DIR / f"{key}.json"
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+        if time.time() - entry.get("cached_at", 0) > (ttl if ttl is not None else RESEARCH_CACHE_TTL):
+            return None
+        return entry.get("payload")
+    except Exception:
+        return None
+
+
+def _cache_put(key: str, payload: Dict) -> None:
+    """Write a JSON payload to the cache atomically. Failures are silently ignored."""
+    try:
+        RESEARCH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=RESEARCH_CACHE_DIR, suffix=".tmp")
+        try:
+            with open(fd, "w") as f:
+                json.dump({"cached_at": time.time(), "payload": payload}, f, default=str)
+            os.replace(tmp, RESEARCH_CACHE_DIR / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception:
+        pass
+
 
 def load_following_cache() -> Dict:
     """Load the following cache file. Returns empty dict if not found."""
@@ -92,7 +302,6 @@ def normalize_linkedin_username(url: str) -> str:
     """Extract LinkedIn username from URL."""
     if not url:
         return ""
-    import re
     url = url.lower().strip().split("?")[0].rstrip("/")
     match = re.search(r'linkedin\.com/in/([^/]+)', url)
     return match.group(1) if match else ""
@@ -165,8 +374,13 @@ def lookup_following_from_cache(email: str = None, linkedin_url: str = None,
     return result
 
 
+@functools.cache
 def check_setup():
-    """Check if environment is configured and show setup instructions if not."""
+    """Check if environment is configured and show setup instructions if not.
+
+    Cached: the env doesn't change mid-process, so repeated main() calls
+    (tests, embedding) skip the re-check and never re-print instructions.
+    """
     env_file_exists = os.path.exists(".env")
     has_nyne_keys = NYNE_API_KEY and NYNE_API_SECRET
     has_llm_key = GEMINI_API_KEY or OPENAI_API_KEY or ANTHROPIC_API_KEY
@@ -265,34 +479,72 @@ class QuestionContext:
 # NYNE.AI API FUNCTIONS
 # ============================================================================
 
+# In-flight submit de-duplication: when concurrent callers (e.g. overlapping
+# research_person invocations) ask for the same thing, the second waits on the
+# first's Future instead of firing a duplicate API request.
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _dedupe_inflight(key: str, fn):
+    """Run fn once per key at a time; concurrent duplicate callers share the result."""
+    with _INFLIGHT_LOCK:
+        existing = _INFLIGHT.get(key)
+        if existing is None:
+            _INFLIGHT[key] = Future()
+    if existing is not None:
+        return existing.result()
+
+    # The Future must resolve even if fn() raises KeyboardInterrupt/SystemExit,
+    # or waiters on the same key would block on it forever
+    result = None
+    try:
+        try:
+            result = fn()
+        except Exception:
+            result = None
+    finally:
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.pop(key)
+        future.set_result(result)
+    return result
+
+
+# Constant portions of the submit payloads, built once and copied per request
+_ENRICHMENT_PAYLOAD = {"newsfeed": ["all"], "ai_enhanced_search": True}
+_FOLLOWING_PAYLOAD = {"type": "following"}
+_ARTICLE_SEARCH_PAYLOAD = {"sort": "recent", "limit": 15}
+
+
 def submit_enrichment(input_data: ResearchInput, headers: Dict) -> Optional[str]:
     """
     Submit person enrichment request.
     Returns request_id or None if failed.
     """
-    payload = {
-        "newsfeed": ["all"],
-        "ai_enhanced_search": True
-    }
+    def _submit():
+        payload = dict(_ENRICHMENT_PAYLOAD)
 
-    if input_data.email:
-        payload["email"] = input_data.email
-    if input_data.linkedin_url:
-        payload["social_media_url"] = input_data.linkedin_url
+        if input_data.email:
+            payload["email"] = input_data.email
+        if input_data.linkedin_url:
+            payload["social_media_url"] = input_data.linkedin_url
 
-    try:
-        response = requests.post(
-            f"{NYNE_BASE_URL}/person/enrichment",
-            headers=headers,
-            json=payload,
-            timeout=30
-        )
-        data = response.json()
-        if data.get("success") and data.get("data", {}).get("request_id"):
-            return data["data"]["request_id"]
-    except Exception:
-        pass
-    return None
+        try:
+            response = _http_post(
+                f"{NYNE_BASE_URL}/person/enrichment",
+                headers=headers,
+                json=payload,
+                timeout=30
+            )
+            data = _parse_response(response)
+            if data.get("success") and data.get("data", {}).get("request_id"):
+                return data["data"]["request_id"]
+        except Exception:
+            pass
+        return None
+
+    return _dedupe_inflight(
+        f"enrichment|{input_data.email}|{input_data.linkedin_url}", _submit)
 
 
 def submit_following(social_url: str, headers: Dict, max_results: int = 500) -> Optional[str]:
@@ -305,23 +557,26 @@ def submit_following(social_url: str, headers: Dict, max_results: int = 500) ->
     if not social_url:
         return None
 
-    try:
-        response = requests.post(
-            f"{NYNE_BASE_URL}/person/interactions",
-            headers=headers,
-            json={
-                "type": "following",
-                "social_media_url": social_url,
-                "max_results": max_results
-            },
-            timeout=30
-        )
-        data = response.json()
-        if data.get("success") and data.get("data", {}).get("request_id"):
-            return data["data"]["request_id"]
-    except Exception:
-        pass
-    return None
+    def _submit():
+        try:
+            response = _http_post(
+                f"{NYNE_BASE_URL}/person/interactions",
+                headers=headers,
+                json={
+                    **_FOLLOWING_PAYLOAD,
+                    "social_media_url": social_url,
+                    "max_results": max_results
+                },
+                timeout=30
+            )
+            data = _parse_response(response)
+            if data.get("success") and data.get("data", {}).get("request_id"):
+                return data["data"]["request_id"]
+        except Exception:
+            pass
+        return None
+
+    return _dedupe_inflight(f"following|{social_url}|{max_results}", _submit)
 
 
 def submit_article_search(name: str, company: str, headers: Dict) -> Optional[str]:
@@ -332,41 +587,63 @@ def submit_article_search(name: str, company: str, headers: Dict) -> Optional[st
     if not name or not company:
         return None
 
-    try:
-        response = requests.post(
-            f"{NYNE_BASE_URL}/person/articlesearch",
-            headers=headers,
-            json={
-                "name": name,
-                "company": company,
-                "sort": "recent",
-                "limit": 15
-            },
-            timeout=30
-        )
-        data = response.json()
-        if data.get("success") and data.get("data", {}).get("request_id"):
-            return data["data"]["request_id"]
-    except Exception:
-        pass
-    return None
+    def _submit():
+        try:
+            response = _http_post(
+                f"{NYNE_BASE_URL}/person/articlesearch",
+                headers=headers,
+                json={
+                    **_ARTICLE_SEARCH_PAYLOAD,
+                    "name": name,
+                    "company": company
+                },
+                timeout=30
+            )
+            data = _parse_response(response)
+            if data.get("success") and data.get("data", {}).get("request_id"):
+                return data["data"]["request_id"]
+        except Exception:
+            pass
+        return None
+
+    return _dedupe_inflight(f"articles|{name}|{company}", _submit)
 
 
 def poll_result(endpoint: str, request_id: str, headers: Dict,
-                max_attempts: int = 60, delay: int = 5) -> Optional[Dict]:
+                max_wait: float = 300.0) -> Optional[Dict]:
     """
-    Poll for async result.
-    Returns result data or None if failed/timeout.
+    Poll for async result with exponential backoff (0.5s doubling to 8s).
+    Asks the server to long-poll (wait=25) so one blocked GET replaces many
+    round-trips; falls back to plain polling if the API rejects the param.
+    Honors a Retry-After header or eta_seconds hint from the API when present.
+    Returns result data or None if failed/timeout (max_wait second budget).
     """
-    for _ in range(max_attempts):
+    deadline = time.monotonic() + max_wait
+    delay = 0.5
+    long_poll = True
+
+    while time.monotonic() < deadline:
         try:
-            response = requests.get(
+            params = {"request_id": request_id}
+            if long_poll:
+                params["wait"] = 25
+            response = _http_get(
                 f"{NYNE_BASE_URL}{endpoint}",
                 headers=headers,
-                params={"request_id": request_id},
-                timeout=30
+                params=params,
+                timeout=35
             )
-            data = response.json()
+
+            # Endpoint doesn't know the wait param - retry immediately without it
+            if long_poll and response.status_code == 400:
+                long_poll = False
+                continue
+
+            # Long-poll timed out server-side with no status change - re-issue
+            if response.status_code == 204:
+                continue
+
+            data = _parse_response(response)
 
             if not data.get("success"):
                 return None
@@ -379,9 +656,22 @@ def poll_result(endpoint: str, request_id: str, headers: Dict,
             elif status == "failed":
                 return None
 
-            time.sleep(delay)
+            # Honor server hints about when the job will be ready
+            hint = response.headers.get("Retry-After") or result_data.get("eta_seconds")
+            sleep_for = delay
+            if hint:
+                try:
+                    sleep_for = max(delay, float(hint))
+                except (TypeError, ValueError):
+                    pass
+
+            # Jitter de-synchronizes concurrent pollers sharing a start time
+            sleep_for += random.uniform(0, 0.25)
+            time.sleep(min(sleep_for, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 2, 8.0)
         except Exception:
-            time.sleep(delay)
+            time.sleep(delay + random.uniform(0, 0.25))
+            delay = min(delay * 2, 8.0)
 
     return None
 
@@ -390,15 +680,36 @@ def poll_result(endpoint: str, request_id: str, headers: Dict,
 # MAIN RESEARCH FUNCTION
 # ============================================================================
 
-def deep_research(input_data: ResearchInput, verbose: bool = True) -> ResearchResults:
+def deep_research(input_data: ResearchInput, verbose: bool = True,
+                  use_cache: bool = True, executor=None) -> ResearchResults:
     """
     Execute deep research on a person using all available Nyne.ai endpoints.
     Gracefully handles missing data - never throws errors.
     Uses pre-fetched cache when available to skip live API calls.
+    Full results are cached on disk for 24h keyed by the input identifiers;
+    pass use_cache=False (CLI: --no-cache) to force fresh API calls.
     """
     results = ResearchResults(errors={})
     request_ids = {}
 
+    # Check the on-disk research cache before paying for any API calls
+    research_key = _cache_key(
+        input_data.email, input_data.linkedin_url, input_data.twitter_url,
+        input_data.instagram_url, input_data.name, input_data.company
+    )
+    if use_cache:
+        cached = _cache_get(research_key)
+        if cached is not None:
+            if verbose:
+                print("✓ Using cached research results (use --no-cache to refresh)")
+            return ResearchResults(
+                enrichment=cached.get("enrichment"),
+                following_twitter=cached.get("following_twitter"),
+                following_instagram=cached.get("following_instagram"),
+                articles=cached.get("articles"),
+                errors={}
+            )
+
     # Check cache for pre-fetched following data
     cached_following = lookup_following_from_cache(
         email=input_data.email,
@@ -432,53 +743,45 @@ def deep_research(input_data: ResearchInput, verbose: bool = True) -> ResearchRe
 
     # -------------------------------------------------------------------------
     # PHASE 1: Submit requests
+    # Submissions are independent POSTs, so they go through the executor
+    # concurrently - one round-trip of wall time instead of up to four.
     # -------------------------------------------------------------------------
     if verbose:
         print("\n[1/3] Submitting API requests...")
 
-    # Enrichment
-    req_id = submit_enrichment(input_data, headers)
-    if req_id:
-        request_ids["enrichment"] = req_id
+    # Enrichment - the most expensive call. Skip it when the caller already
+    # supplied everything the second wave would extract from it (name, company,
+    # twitter) and there's no email/linkedin to enrich on anyway.
+    enrichment_unneeded = (
+        input_data.name and input_data.company and input_data.twitter_url
+        and not input_data.email and not input_data.linkedin_url
+    )
+
+    submit_jobs = {}
+    if enrichment_unneeded:
         if verbose:
-            print("  ✓ Enrichment request submitted")
-    elif verbose:
-        print("  - Enrichment: skipped (no valid input)")
+            print("  - Enrichment: skipped (name/company/twitter already provided)")
+    else:
+        submit_jobs["enrichment"] = lambda: submit_enrichment(input_data, headers)
 
     # Twitter and/or Instagram following (for psychographics)
     # Skip if already have cached data
     if input_data.twitter_url and not results.following_twitter:
-        req_id = submit_following(input_data.twitter_url, headers)
-        if req_id:
-            request_ids["following_twitter"] = req_id
-            if verbose:
-                print("  ✓ Social following request submitted")
+        submit_jobs["following_twitter"] = lambda: submit_following(input_data.twitter_url, headers)
 
     if input_data.instagram_url and not results.following_instagram:
-        req_id = submit_following(input_data.instagram_url, headers)
-        if req_id:
-            request_ids["following_instagram"] = req_id
-            if verbose:
-                print("  ✓ Social following request submitted")
+        submit_jobs["following_instagram"] = lambda: submit_following(input_data.instagram_url, headers)
 
     # Article search
     if input_data.name and input_data.company:
-        req_id = submit_article_search(input_data.name, input_data.company, headers)
-        if req_id:
-            request_ids["articles"] = req_id
-            if verbose:
-                print("  ✓ Article search submitted")
-
-    if not request_ids:
-        if verbose:
-            print("\n  No requests submitted. Check your input.")
-        return results
+        submit_jobs["articles"] = lambda: submit_article_search(input_data.name, input_data.company, headers)
 
-    # -------------------------------------------------------------------------
-    # PHASE 2: Poll for results
-    # -------------------------------------------------------------------------
-    if verbose:
-        print(f"\n[2/3] Waiting for {len(request_ids)} API results...")
+    submit_labels = {
+        "enrichment": "Enrichment request submitted",
+        "following_twitter": "Social following request submitted",
+        "following_instagram": "Social following request submitted",
+        "articles": "Article search submitted"
+    }
 
     endpoint_map = {
         "enrichment": "/person/enrichment",
@@ -491,28 +794,19 @@ def deep_research(input_data: ResearchInput, verbose: bool = True) -> ResearchRe
         result = poll_result(endpoint_map[key], req_id, headers)
         return key, result
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {
-            executor.submit(poll_task, key, req_id): key
-            for key, req_id in request_ids.items()
-        }
+    def submit_and_poll_task(key: str, submit_fn, *args) -> tuple:
+        req_id = submit_fn(*args, headers)
+        if not req_id:
+            return key, None
+        return key, poll_result(endpoint_map[key], req_id, headers)
 
-        for future in as_completed(futures):
-            try:
-                key, result = future.result()
-                if result:
-                    setattr(results, key, result)
-                    if verbose:
-                        print(f"  ✓ {key}: completed")
-                elif verbose:
-                    print(f"  - {key}: no data")
-            except Exception:
-                pass
-
-    # -------------------------------------------------------------------------
-    # PHASE 3: Extract additional data from enrichment
-    # -------------------------------------------------------------------------
-    if results.enrichment:
+    def second_wave_tasks() -> list:
+        """
+        Parse the completed enrichment and return (key, callable) tasks for
+        data we can now fetch (articles by name/company, following by
+        discovered social URLs). Cache hits are applied directly.
+        """
+        tasks = []
         result_data = results.enrichment.get("result", {})
 
         # Extract name if not provided
@@ -528,70 +822,116 @@ def deep_research(input_data: ResearchInput, verbose: bool = True) -> ResearchRe
             if careers:
                 input_data.company = careers[0].get("company_name", "")
 
-        # Submit article search if we now have name/company
+        # Article search if we now have name/company
         if input_data.name and input_data.company and "articles" not in request_ids:
             if verbose:
                 print(f"\n  → Found: {input_data.name} @ {input_data.company}")
                 print("  → Fetching articles...")
+            tasks.append(("articles", lambda: submit_and_poll_task(
+                "articles", submit_article_search, input_data.name, input_data.company)))
 
-            req_id = submit_article_search(input_data.name, input_data.company, headers)
-            if req_id:
-                result = poll_result("/person/articlesearch", req_id, headers)
-                if result:
-                    results.articles = result
-                    if verbose:
-                        print("  ✓ Article search: completed")
-
-        # Extract Twitter and Instagram from enrichment if not already provided
+        # Twitter and Instagram following from discovered social profiles
         social_profiles = result_data.get("social_profiles", {})
 
-        # Try Twitter if not already fetched
         if "following_twitter" not in request_ids and not results.following_twitter:
-            twitter = social_profiles.get("twitter", {})
-            twitter_url = twitter.get("url")
-
+            twitter_url = social_profiles.get("twitter", {}).get("url")
             if twitter_url:
                 if verbose:
                     print(f"  → Found social profile")
-
-                # Check cache first with the discovered Twitter URL
                 cache_check = lookup_following_from_cache(twitter_url=twitter_url)
                 if cache_check.get("twitter"):
                     results.following_twitter = cache_check["twitter"]
                 else:
                     if verbose:
                         print("  → Fetching following list...")
-                    req_id = submit_following(twitter_url, headers)
-                    if req_id:
-                        result = poll_result("/person/interactions", req_id, headers)
-                        if result:
-                            results.following_twitter = result
-                            if verbose:
-                                print("  ✓ Following list: completed")
-
-        # Try Instagram if not already fetched
-        if "following_instagram" not in request_ids and not results.following_instagram:
-            instagram = social_profiles.get("instagram", {})
-            instagram_url = instagram.get("url")
+                    tasks.append(("following_twitter", lambda: submit_and_poll_task(
+                        "following_twitter", submit_following, twitter_url)))
 
+        if "following_instagram" not in request_ids and not results.following_instagram:
+            instagram_url = social_profiles.get("instagram", {}).get("url")
             if instagram_url:
                 if verbose:
                     print(f"  → Found social profile")
-
-                # Check cache first with the discovered Instagram URL
                 cache_check = lookup_following_from_cache(instagram_url=instagram_url)
                 if cache_check.get("instagram"):
                     results.following_instagram = cache_check["instagram"]
                 else:
                     if verbose:
                         print("  → Fetching following list...")
-                    req_id = submit_following(instagram_url, headers)
-                    if req_id:
-                        result = poll_result("/person/interactions", req_id, headers)
-                        if result:
-                            results.following_instagram = result
-                            if verbose:
-                                print("  ✓ Following list: completed")
+                    tasks.append(("following_instagram", lambda: submit_and_poll_task(
+                        "following_instagram", submit_following, instagram_url)))
+
+        return tasks
+
+    # Callers may supply a private pool (research_people does, so one
+    # person's sub-tasks never starve a sibling's); default is the shared one
+    executor = executor or _EXECUTOR
+    # Fan out the Phase-1 submissions concurrently
+    submit_futures = {
+        executor.submit(job): key for key, job in submit_jobs.items()
+    }
+    for future in as_completed(submit_futures):
+        key = submit_futures[future]
+        try:
+            req_id = future.result()
+        except Exception:
+            req_id = None
+        if req_id:
+            request_ids[key] = req_id
+            if verbose:
+                print(f"  ✓ {submit_labels[key]}")
+        elif verbose and key == "enrichment":
+            print("  - Enrichment: skipped (no valid input)")
+
+    if not request_ids:
+        if verbose:
+            print("\n  No requests submitted. Check your input.")
+        return results
+
+    # ---------------------------------------------------------------------
+    # PHASE 2: Poll for results
+    # Second-wave requests discovered from enrichment (articles, following)
+    # are submitted into the same executor the moment enrichment completes,
+    # so their latency overlaps the remaining first-wave polls.
+    # ---------------------------------------------------------------------
+    if verbose:
+        print(f"\n[2/3] Waiting for {len(request_ids)} API results...")
+
+    pending = {
+        executor.submit(poll_task, key, req_id)
+        for key, req_id in request_ids.items()
+    }
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                key, result = future.result()
+            except Exception:
+                continue
+
+            if result:
+                setattr(results, key, result)
+                if verbose:
+                    print(f"  ✓ {key}: completed")
+            elif verbose:
+                print(f"  - {key}: no data")
+
+            # Enrichment unlocks the second wave - submit immediately so it
+            # runs alongside whatever first-wave polls are still in flight
+            if key == "enrichment" and result:
+                for _, task in second_wave_tasks():
+                    pending.add(executor.submit(task))
+
+    # Persist what we fetched so a repeat run is a disk read, not an API cycle
+    if use_cache and (results.enrichment or results.following_twitter
+                      or results.following_instagram or results.articles):
+        _cache_put(research_key, {
+            "enrichment": results.enrichment,
+            "following_twitter": results.following_twitter,
+            "following_instagram": results.following_instagram,
+            "articles": results.articles
+        })
 
     if verbose:
         print("\n[3/3] Research complete!")
@@ -688,6 +1028,12 @@ HERE IS ALL THE RAW DATA TO ANALYZE:
 Now write the most thorough dossier possible. Be exhaustive. Go deep.'''
 
 
+# {data} is DOSSIER_PROMPT's only placeholder - pre-split the template once at
+# import so building a prompt is a two-string concat rather than a .format scan
+# over the whole ~2KB template per LLM call
+_DOSSIER_PROMPT_PREFIX, _DOSSIER_PROMPT_SUFFIX = DOSSIER_PROMPT.split("{data}")
+
+
 # ============================================================================
 # QUESTION ANALYZER PROMPT (Phase 0 for simulation mode)
 # ============================================================================
@@ -1626,57 +1972,178 @@ This simulation should feel like talking to someone who KNOWS this person well 
 # LLM CALL FUNCTIONS
 # ============================================================================
 
-def _call_gemini(prompt: str) -> Optional[str]:
-    """Make a single Gemini API call."""
-    if not GEMINI_API_KEY:
-        return None
-    try:
-        import google.generativeai as genai
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel(
-            'gemini-2.5-flash',
-            generation_config={"temperature": 0.7, "max_output_tokens": 65536}
-        )
-        response = model.generate_content(prompt)
-        return response.text
-    except Exception as e:
-        print(f"    ⚠ Gemini error: {e}")
-        return None
+_LLM_RETRY_ATTEMPTS = 3
+
+# LLM responses are cached on disk (same store as research results) keyed by
+# model + prompt hash, so re-running over identical data skips the API call
+# and its spend entirely. Disabled alongside the research cache by --no-cache.
+_LLM_CACHE_TTL = 24 * 60 * 60
+_llm_cache_enabled = True
+
+
+def set_llm_cache_enabled(enabled: bool):
+    """Enable/disable the on-disk LLM response cache (CLI: --no-cache)."""
+    global _llm_cache_enabled
+    _llm_cache_enabled = enabled
 
 
-def _call_openai(prompt: str) -> Optional[str]:
-    """Make a single OpenAI API call."""
-    if not OPENAI_API_KEY:
+def _llm_cache_get(model: str, prompt: str) -> Optional[str]:
+    if not _llm_cache_enabled:
         return None
-    try:
-        from openai import OpenAI
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=16384
-        )
-        return response.choices[0].message.content
-    except Exception:
+    cached = _cache_get(_cache_key("llm", model, prompt), ttl=_LLM_CACHE_TTL)
+    return cached.get("text") if isinstance(cached, dict) else None
+
+
+def _llm_cache_put(model: str, prompt: str, text: str) -> None:
+    if _llm_cache_enabled and text:
+        _cache_put(_cache_key("llm", model, prompt), {"text": text})
+
+# Rough per-provider prompt budgets in characters (~4 chars/token with
+# headroom). A prompt over the limit would be rejected server-side anyway -
+# checking locally turns a wasted ~10s round-trip into a free skip.
+_PROMPT_CHAR_LIMIT = {
+    "gemini": 4_000_000,
+    "openai": 500_000,
+    "anthropic": 800_000
+}
+
+
+def _prompt_fits(prompt: str, provider: str) -> bool:
+    """Cheap local check that a prompt is within the provider's budget."""
+    fits = len(prompt) <= _PROMPT_CHAR_LIMIT.get(provider, 500_000)
+    if not fits:
+        print(f"    ⚠ Prompt too large for {provider} "
+              f"({len(prompt):,} chars), trying next provider...", flush=True)
+    return fits
+
+
+def _is_transient_llm_error(exc: Exception) -> bool:
+    """
+    Rate limits, overload, and 5xx are worth retrying on the same provider;
+    auth/quota/config problems are not - fail over to the next LLM instead.
+    """
+    status = getattr(exc, "status_code", None)
+    if status in (408, 429, 500, 502, 503, 504, 529):
+        return True
+    if status in (401, 403):
+        return False
+    msg = str(exc).lower()
+    return any(s in msg for s in (
+        "rate limit", "overloaded", "timeout", "timed out",
+        "temporarily", "unavailable", "connection"
+    ))
+
+
+def _call_gemini(prompt: str, on_chunk=None) -> Optional[str]:
+    """
+    Make a single Gemini API call, streaming the response.
+    Transient failures (rate limit, 5xx) are retried with backoff before
+    giving up; permanent ones (auth, missing SDK) return None immediately.
+    on_chunk (optional) is called with each text chunk as it arrives.
+    """
+    if _GEMINI_MODEL is None:
         return None
+    cached = _llm_cache_get("gemini-2.5-flash", prompt)
+    if cached:
+        if on_chunk:
+            on_chunk(cached)
+        return cached
+    for attempt in range(_LLM_RETRY_ATTEMPTS):
+        try:
+            response = _GEMINI_MODEL.generate_content(prompt, stream=True)
+            parts = []
+            for chunk in response:
+                text = chunk.text
+                if text:
+                    parts.append(text)
+                    if on_chunk:
+                        on_chunk(text)
+            text = "".join(parts) or None
+            _llm_cache_put("gemini-2.5-flash", prompt, text)
+            return text
+        except Exception as e:
+            if _is_transient_llm_error(e) and attempt < _LLM_RETRY_ATTEMPTS - 1:
+                time.sleep(2 ** attempt)
+                continue
+            print(f"    ⚠ Gemini error: {e}")
+            return None
+    return None
 
 
-def _call_anthropic(prompt: str) -> Optional[str]:
-    """Make a single Anthropic API call."""
-    if not ANTHROPIC_API_KEY:
+def _call_openai(prompt: str, on_chunk=None) -> Optional[str]:
+    """
+    Make a single OpenAI API call, streaming the response.
+    Transient failures are retried with backoff; permanent ones fail over.
+    on_chunk (optional) is called with each text chunk as it arrives.
+    """
+    if _OPENAI_CLIENT is None:
         return None
-    try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=64000,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text
-    except Exception:
+    cached = _llm_cache_get("gpt-4o-mini", prompt)
+    if cached:
+        if on_chunk:
+            on_chunk(cached)
+        return cached
+    for attempt in range(_LLM_RETRY_ATTEMPTS):
+        try:
+            response = _OPENAI_CLIENT.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7,
+                max_tokens=16384,
+                stream=True
+            )
+            parts = []
+            for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    if on_chunk:
+                        on_chunk(delta)
+            text = "".join(parts) or None
+            _llm_cache_put("gpt-4o-mini", prompt, text)
+            return text
+        except Exception as e:
+            if _is_transient_llm_error(e) and attempt < _LLM_RETRY_ATTEMPTS - 1:
+                time.sleep(2 ** attempt)
+                continue
+            return None
+    return None
+
+
+def _call_anthropic(prompt: str, on_chunk=None) -> Optional[str]:
+    """
+    Make a single Anthropic API call, streaming the response.
+    Transient failures are retried with backoff; permanent ones fail over.
+    on_chunk (optional) is called with each text chunk as it arrives.
+    """
+    if _ANTHROPIC_CLIENT is None:
         return None
+    cached = _llm_cache_get("claude-sonnet-4-20250514", prompt)
+    if cached:
+        if on_chunk:
+            on_chunk(cached)
+        return cached
+    for attempt in range(_LLM_RETRY_ATTEMPTS):
+        try:
+            parts = []
+            with _ANTHROPIC_CLIENT.messages.stream(
+                model="claude-sonnet-4-20250514",
+                max_tokens=64000,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                for text in stream.text_stream:
+                    parts.append(text)
+                    if on_chunk:
+                        on_chunk(text)
+            full = "".join(parts) or None
+            _llm_cache_put("claude-sonnet-4-20250514", prompt, full)
+            return full
+        except Exception as e:
+            if _is_transient_llm_error(e) and attempt < _LLM_RETRY_ATTEMPTS - 1:
+                time.sleep(2 ** attempt)
+                continue
+            return None
+    return None
 
 
 # Global backup LLM setting
@@ -1709,7 +2176,8 @@ def _get_llm_caller(llm: str = "auto"):
             return _call_anthropic, "anthropic"
     return None, None
 
-def _call_llm_with_fallback(prompt: str, primary_llm: str = "auto", backup_llm: str = None) -> Optional[str]:
+def _call_llm_with_fallback(prompt: str, primary_llm: str = "auto", backup_llm: str = None,
+                            on_chunk=None) -> Optional[str]:
     """Call LLM with automatic fallback. Gemini -> OpenAI by default."""
     # Default fallback chain: gemini -> openai -> anthropic
     fallback_order = ["gemini", "openai", "anthropic"]
@@ -1720,8 +2188,8 @@ def _call_llm_with_fallback(prompt: str, primary_llm: str = "auto", backup_llm:
 
     # Try primary
     caller, primary_name = _get_llm_caller(primary_llm)
-    if caller:
-        result = caller(prompt)
+    if caller and _prompt_fits(prompt, primary_name):
+        result = caller(prompt, on_chunk=on_chunk)
         if result:
             return result
 
@@ -1730,25 +2198,92 @@ def _call_llm_with_fallback(prompt: str, primary_llm: str = "auto", backup_llm:
         if fallback == primary_llm:
             continue  # Skip primary, already tried
         backup_caller, backup_name = _get_llm_caller(fallback)
-        if backup_caller:
+        if backup_caller and _prompt_fits(prompt, backup_name):
             print(f"    ↻ Falling back to {backup_name}...", flush=True)
-            result = backup_caller(prompt)
+            result = backup_caller(prompt, on_chunk=on_chunk)
             if result:
                 return result
 
     return None
 
 
-def _batch_following_data(following_data: Dict, batch_size: int = 75) -> list:
-    """Split following data into batches."""
-    interactions = following_data.get("result", {}).get("interactions", [])
-    if not interactions:
-        return []
+# Enrichment fields the dossier/simulation prompts actually reference.
+# Nyne responses carry plenty more (raw HTML excerpts, thumbnails, request
+# metadata) that only inflates the prompt.
+_ENRICHMENT_KEEP_FIELDS = (
+    "firstname", "lastname", "headline", "bio", "location", "birthdate",
+    "languages", "emails", "altemails", "social_profiles", "recommendations",
+    "volunteering", "skills", "educations_info"
+)
+_CAREER_KEEP_FIELDS = ("company_name", "title", "start_date", "end_date", "description")
+_POST_KEEP_FIELDS = ("text", "date", "likes", "url")
+_ARTICLE_KEEP_FIELDS = ("title", "url", "date", "snippet", "source", "publication")
+_MAX_POSTS_FOR_LLM = 20
+
+
+def _strip_empty(value):
+    """Recursively drop None and empty strings/lists/dicts from a structure."""
+    if isinstance(value, dict):
+        cleaned = {k: _strip_empty(v) for k, v in value.items()}
+        return {k: v for k, v in cleaned.items() if v not in (None, "", [], {})}
+    if isinstance(value, list):
+        cleaned = [_strip_empty(v) for v in value]
+        return [v for v in cleaned if v not in (None, "", [], {})]
+    return value
+
+
+def _project_enrichment_for_llm(enrichment: Dict) -> Dict:
+    """
+    Project an enrichment response down to the fields the prompts use.
+    Cuts prompt tokens (and LLM latency/cost, which scale with prompt length)
+    without losing anything the dossier sections cite.
+    """
+    result = enrichment.get("result", {}) or {}
+    kept = {k: result[k] for k in _ENRICHMENT_KEEP_FIELDS if k in result}
+
+    careers = result.get("careers_info") or []
+    if careers:
+        kept["careers_info"] = [
+            {k: c.get(k) for k in _CAREER_KEEP_FIELDS if isinstance(c, dict) and k in c}
+            for c in careers
+        ]
+
+    posts = result.get("posts") or []
+    if posts:
+        kept["posts"] = [
+            {k: p.get(k) for k in _POST_KEEP_FIELDS if isinstance(p, dict) and k in p}
+            for p in posts[:_MAX_POSTS_FOR_LLM]
+        ]
 
-    batches = []
-    for i in range(0, len(interactions), batch_size):
-        batches.append(interactions[i:i + batch_size])
-    return batches
+    return _strip_empty(kept)
+
+
+def _project_articles_for_llm(articles: Dict) -> Any:
+    """Keep only title/url/date/snippet-style fields from the article results."""
+    result = articles.get("result", articles) or {}
+    items = result.get("articles") if isinstance(result, dict) else result
+    if not isinstance(items, list):
+        return _strip_empty(result)
+    return _strip_empty([
+        {k: a.get(k) for k in _ARTICLE_KEEP_FIELDS if isinstance(a, dict) and k in a}
+        for a in items
+    ])
+
+
+def _iter_batches(items: list, batch_size: int):
+    """Yield successive batches of items without building an intermediate list of slices."""
+    it = iter(items or [])
+    while True:
+        batch = list(itertools.islice(it, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _batch_following_data(following_data: Dict, batch_size: int = 75):
+    """Yield batches of interactions on demand."""
+    interactions = following_data.get("result", {}).get("interactions", [])
+    yield from _iter_batches(interactions, batch_size)
 
 
 def _slim_following_for_llm(following_list: list) -> list:
@@ -1769,6 +2304,26 @@ def _slim_following_for_llm(following_list: list) -> list:
     return slim
 
 
+def _dedupe_following(following_list: list) -> list:
+    """
+    Prune the combined following list before batching: drop entries with no
+    handle (zero signal) and collapse handles followed on both Twitter and
+    Instagram to one entry. Highest-follower accounts sort first so the
+    earliest batches carry the strongest signals.
+    """
+    seen = set()
+    deduped = []
+    for item in following_list:
+        handle = (item.get("actor", {}).get("username") or "").strip().lower()
+        if not handle or handle in seen:
+            continue
+        seen.add(handle)
+        deduped.append(item)
+    deduped.sort(key=lambda x: x.get("actor", {}).get("followers_count") or 0,
+                 reverse=True)
+    return deduped
+
+
 def _following_to_compact_string(following_list: list) -> str:
     """
     Convert following list to compact string format for LLM prompts.
@@ -1781,7 +2336,7 @@ def _following_to_compact_string(following_list: list) -> str:
         handle = actor.get("username", "unknown")
         name = actor.get("display_name", "")
         followers = actor.get("followers_count", "?")
-        bio = (actor.get("bio", "") or "").replace("\n", " ").strip()
+        bio = (actor.get("bio", "") or "").replace("\n", " ").strip()[:200]
         lines.append(f"@{handle} | {name} | {followers} followers | {bio}")
     return "\n".join(lines)
 
@@ -1831,10 +2386,20 @@ def analyze_question(question: str, llm: str = "auto", verbose: bool = True) ->
     )
 
 
-def generate_dossier(results: ResearchResults, llm: str = "auto", verbose: bool = True, question: Optional[str] = None) -> Optional[str]:
+def generate_dossier(results: ResearchResults, llm: str = "auto", verbose: bool = True,
+                     question: Optional[str] = None, write=None,
+                     use_cache: bool = True, refresh: bool = False,
+                     executor=None) -> Optional[str]:
     """
     Generate intelligent dossier using batched LLM calls for deep analysis.
     If question is provided, runs in simulation mode with question-adaptive analysis.
+    If write is provided (e.g. an open file's .write), the final synthesis is
+    streamed through it chunk-by-chunk as tokens arrive.
+    Finished dossiers are memoized on disk by content hash + LLM + question,
+    so a rerun over unchanged data skips the whole LLM pipeline.
+    refresh=True (CLI: --refresh-dossier) skips the cache read but still
+    stores the regenerated dossier; use_cache=False (--no-cache) disables
+    both read and write.
 
     1. (Optional) Analyze the question to determine cluster priorities
     2. Batch the following lists into chunks
@@ -1857,10 +2422,33 @@ def generate_dossier(results: ResearchResults, llm: str = "auto", verbose: bool
         _log("⚠ No LLM available. Set GEMINI_API_KEY, OPENAI_API_KEY, or ANTHROPIC_API_KEY")
         return None
 
+    # Memoize the finished dossier: same data + same LLM + same question means
+    # the expensive multi-phase pipeline would reproduce the same output
+    dossier_key = None
+    if use_cache:
+        serialized = _json_dumps({
+            "enrichment": results.enrichment,
+            "following_twitter": results.following_twitter,
+            "following_instagram": results.following_instagram,
+            "articles": results.articles
+        }, indent=False)
+        dossier_key = _cache_key(
+            "dossier", llm, question or "",
+            hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+        )
+        # On refresh, skip the read but keep dossier_key so the regenerated
+        # dossier still replaces the stale cache entry below
+        cached = None if refresh else _cache_get(dossier_key)
+        if cached and cached.get("dossier"):
+            _log("✓ Using cached dossier (use --refresh-dossier to regenerate)")
+            if write:
+                write(cached["dossier"])
+            return cached["dossier"]
+
     # Wrap with fallback support - capture backup at definition time for thread safety
     backup = get_backup_llm()
-    def llm_call(prompt: str) -> Optional[str]:
-        return _call_llm_with_fallback(prompt, llm, backup)
+    def llm_call(prompt: str, on_chunk=None) -> Optional[str]:
+        return _call_llm_with_fallback(prompt, llm, backup, on_chunk=on_chunk)
 
     _log(f"Using {llm_name} for deep analysis (fallback: gemini→openai→anthropic)")
 
@@ -1889,6 +2477,8 @@ def generate_dossier(results: ResearchResults, llm: str = "auto", verbose: bool
     careers = result_data.get("careers_info", [])
     person_company = careers[0].get("company_name", "Unknown") if careers else "Unknown"
 
+    executor = executor or _EXECUTOR
+
     # Collect all following data
     all_following = []
     if results.following_twitter:
@@ -1901,30 +2491,46 @@ def generate_dossier(results: ResearchResults, llm: str = "auto", verbose: bool
         for item in ig_interactions:
             item["_source"] = "instagram"
         all_following.extend(ig_interactions)
+    all_following = _dedupe_following(all_following)
 
     # Batch the following data
     batch_size = 75
-    batches = [all_following[i:i + batch_size] for i in range(0, len(all_following), batch_size)] if all_following else []
+    super_batch = 4  # batches multiplexed into one LLM request
+    total_batches = -(-len(all_following) // batch_size) if all_following else 0
 
     following_analyses = []
 
-    if batches:
-        _log(f"PHASE 1: Analyzing {len(all_following)} followed accounts in {len(batches)} batches...")
+    if total_batches:
+        # Group batches into super-batches so one LLM request covers several,
+        # amortizing per-request connection and model-startup overhead.
+        # Batches are materialized one at a time via _iter_batches rather
+        # than building the whole list of slices up front.
+        total_groups = -(-total_batches // super_batch)
+        _log(f"PHASE 1: Analyzing {len(all_following)} followed accounts in {total_batches} batches ({total_groups} LLM requests)...")
         _batch_start = _time.time()
 
         # Prepare batch prompts
         batch_prompts = []
-        for i, batch in enumerate(batches):
-            batch_data = _following_to_compact_string(batch)
+        for g, chunk in enumerate(_iter_batches(all_following, batch_size * super_batch)):
+            sections = []
+            for j, batch in enumerate(_iter_batches(chunk, batch_size)):
+                sections.append(
+                    f"=== BATCH {g * super_batch + j + 1} of {total_batches} ===\n"
+                    + _following_to_compact_string(batch)
+                )
             prompt = BATCH_ANALYSIS_PROMPT.format(
                 person_name=person_name,
                 person_role=person_role,
                 person_company=person_company,
-                batch_size=len(batch),
-                batch_num=i + 1,
-                total_batches=len(batches),
-                batch_data=batch_data
+                batch_size=len(chunk),
+                batch_num=g + 1,
+                total_batches=total_groups,
+                batch_data="\n\n".join(sections)
             )
+            if len(sections) > 1:
+                prompt += f'''
+
+The accounts above are split into {len(sections)} labeled batches. Analyze every batch, in order, and start each batch's analysis with its "=== BATCH ... ===" header so the sections stay separable.'''
             # Inject question context into batch prompts
             if question_ctx:
                 signals_str = ", ".join(question_ctx.specific_signals) if question_ctx.specific_signals else "any accounts relevant to the question"
@@ -1935,7 +2541,7 @@ The goal is to understand how this person would respond to: "{question_ctx.quest
 Pay special attention to: {signals_str}
 Flag any accounts that DIRECTLY relate to this topic — these are the most valuable signals.
 For each flagged account, explain WHY it's relevant to the question.'''
-            batch_prompts.append((i, prompt))
+            batch_prompts.append((g, prompt))
 
         # Run batch analyses concurrently
         _batch_times = {}
@@ -1946,24 +2552,21 @@ For each flagged account, explain WHY it's relevant to the question.'''
             _batch_times[idx] = _time.time() - _s
             return idx, result
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(analyze_batch, bp): bp[0] for bp in batch_prompts}
-            completed_count = 0
+        # Pre-sized slot list keeps submission order without a post-hoc sort
+        analyses = [None] * len(batch_prompts)
 
-            for future in as_completed(futures):
-                idx, analysis = future.result()
-                elapsed = time.time() - _batch_start
-                if analysis:
-                    following_analyses.append((idx, analysis))
-                    _log(f"  ✓ Batch {idx + 1}/{len(batches)} done ({_batch_times.get(idx, 0):.1f}s)")
-                else:
-                    _log(f"  ✗ Batch {idx + 1}/{len(batches)} FAILED")
+        futures = {executor.submit(analyze_batch, bp): bp[0] for bp in batch_prompts}
 
-        _log(f"PHASE 1 COMPLETE: {len(following_analyses)}/{len(batches)} batches", _batch_start)
+        for future in as_completed(futures):
+            idx, analysis = future.result()
+            if analysis:
+                analyses[idx] = analysis
+                _log(f"  ✓ Request {idx + 1}/{total_groups} done ({_batch_times.get(idx, 0):.1f}s)")
+            else:
+                _log(f"  ✗ Request {idx + 1}/{total_groups} FAILED")
 
-        # Sort by batch index
-        following_analyses.sort(key=lambda x: x[0])
-        following_analyses = [a[1] for a in following_analyses]
+        following_analyses = [a for a in analyses if a]
+        _log(f"PHASE 1 COMPLETE: {len(following_analyses)}/{total_groups} requests", _batch_start)
 
     # =========================================================================
     # PHASE 2: Deep Cluster Analysis
@@ -2068,19 +2671,16 @@ Pay extra attention to any signals that would help predict their stance on this
             _cluster_times[cluster_name] = _time.time() - _s
             return cluster_name, result
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(run_cluster, (name, prompt)): name
-                      for name, prompt in cluster_prompts.items()}
-            cluster_done = 0
-
-            for future in as_completed(futures):
-                cluster_name, analysis = future.result()
-                elapsed = time.time() - _cluster_start
-                if analysis:
-                    cluster_analyses[cluster_name] = analysis
-                    _log(f"  ✓ {cluster_name.capitalize()} cluster done ({_cluster_times.get(cluster_name, 0):.1f}s)")
-                else:
-                    _log(f"  ✗ {cluster_name.capitalize()} cluster FAILED")
+        futures = {executor.submit(run_cluster, (name, prompt)): name
+                   for name, prompt in cluster_prompts.items()}
+
+        for future in as_completed(futures):
+            cluster_name, analysis = future.result()
+            if analysis:
+                cluster_analyses[cluster_name] = analysis
+                _log(f"  ✓ {cluster_name.capitalize()} cluster done ({_cluster_times.get(cluster_name, 0):.1f}s)")
+            else:
+                _log(f"  ✗ {cluster_name.capitalize()} cluster FAILED")
 
         _log(f"PHASE 2 COMPLETE: {sum(1 for v in cluster_analyses.values() if v)}/5 clusters", _cluster_start)
 
@@ -2089,9 +2689,13 @@ Pay extra attention to any signals that would help predict their stance on this
     # Combine everything into the final dossier
     # =========================================================================
 
-    enrichment_str = json.dumps(enrichment, indent=2, default=str) if enrichment else "No enrichment data"
+    # Project to the fields the prompts cite and skip pretty-printing - the
+    # indent whitespace alone is a meaningful share of tokens on nested JSON
+    enrichment_str = _json_dumps(_project_enrichment_for_llm(enrichment),
+                                 indent=False) if enrichment else "No enrichment data"
     following_str = "\n\n---\n\n".join(following_analyses) if following_analyses else "No following data analyzed"
-    articles_str = json.dumps(results.articles, indent=2, default=str) if results.articles else "No articles found"
+    articles_str = _json_dumps(_project_articles_for_llm(results.articles),
+                               indent=False) if results.articles else "No articles found"
 
     if question_ctx:
         # Simulation mode: use SIMULATION_SYNTHESIS_PROMPT
@@ -2144,32 +2748,35 @@ Additional focus: {question_ctx.additional_focus}"""
             articles_data=articles_str
         )
 
-    # Generate final output
-    dossier = llm_call(synthesis_prompt)
+    # Generate final output (streamed through the write callback when given)
+    dossier = llm_call(synthesis_prompt, on_chunk=write)
 
     mode_label = "Simulation" if question_ctx else "Synthesis"
     _log(f"PHASE 3 COMPLETE: {mode_label} done", _synth_start)
     _log(f"=== TOTAL LLM TIME: {_time.time() - _start_total:.1f}s ===")
 
+    if dossier_key and dossier:
+        _cache_put(dossier_key, {"dossier": dossier})
+
     return dossier
 
 
 # Legacy functions for backwards compatibility
 def generate_dossier_gemini(data: Dict) -> Optional[str]:
     """Legacy: Generate dossier using Google Gemini."""
-    prompt = DOSSIER_PROMPT.format(data=json.dumps(data, indent=2, default=str))
+    prompt = _DOSSIER_PROMPT_PREFIX + _json_dumps(data) + _DOSSIER_PROMPT_SUFFIX
     return _call_gemini(prompt)
 
 
 def generate_dossier_openai(data: Dict) -> Optional[str]:
     """Legacy: Generate dossier using OpenAI."""
-    prompt = DOSSIER_PROMPT.format(data=json.dumps(data, indent=2, default=str))
+    prompt = _DOSSIER_PROMPT_PREFIX + _json_dumps(data) + _DOSSIER_PROMPT_SUFFIX
     return _call_openai(prompt)
 
 
 def generate_dossier_anthropic(data: Dict) -> Optional[str]:
     """Legacy: Generate dossier using Anthropic Claude."""
-    prompt = DOSSIER_PROMPT.format(data=json.dumps(data, indent=2, default=str))
+    prompt = _DOSSIER_PROMPT_PREFIX + _json_dumps(data) + _DOSSIER_PROMPT_SUFFIX
     return _call_anthropic(prompt)
 
 
@@ -2193,25 +2800,31 @@ def _legacy_generate_dossier(results: ResearchResults, llm: str = "auto", verbos
     if verbose:
         print("\n[LLM] Generating dossier...")
 
+    # Serialize and format the prompt once - re-doing this per provider on the
+    # fallback path means walking a potentially multi-MB dict up to three times
+    prompt = _DOSSIER_PROMPT_PREFIX + _json_dumps(data) + _DOSSIER_PROMPT_SUFFIX
+
     # Try LLMs in order of preference
     generators = []
     if llm == "auto":
         generators = [
-            ("gemini", generate_dossier_gemini),
-            ("openai", generate_dossier_openai),
-            ("anthropic", generate_dossier_anthropic)
+            ("gemini", _call_gemini),
+            ("openai", _call_openai),
+            ("anthropic", _call_anthropic)
         ]
     elif llm == "gemini":
-        generators = [("gemini", generate_dossier_gemini)]
+        generators = [("gemini", _call_gemini)]
     elif llm == "openai":
-        generators = [("openai", generate_dossier_openai)]
+        generators = [("openai", _call_openai)]
     elif llm == "anthropic":
-        generators = [("anthropic", generate_dossier_anthropic)]
+        generators = [("anthropic", _call_anthropic)]
 
-    for name, generator in generators:
+    for name, caller in generators:
+        if not _prompt_fits(prompt, name):
+            continue
         if verbose:
             print(f"  Trying {name}...")
-        result = generator(data)
+        result = caller(prompt)
         if result:
             if verbose:
                 print(f"  ✓ Generated with {name}")
@@ -2226,11 +2839,51 @@ def _legacy_generate_dossier(results: ResearchResults, llm: str = "auto", verbos
 # CLI INTERFACE
 # ============================================================================
 
-def main():
-    # Check if setup is complete
-    if not check_setup():
-        sys.exit(1)
+def _drop_empty(payload: Dict) -> Dict:
+    """Drop top-level keys whose values are empty (None, [], {})."""
+    return {k: v for k, v in payload.items() if v}
+
+
+def _print_large(text) -> None:
+    """
+    Write a large string (or pre-encoded bytes) to stdout via the binary
+    buffer - skips the TextIOWrapper's incremental utf-8 encoder and the
+    extra full-size copy a "\n" + text concatenation would make.
+    """
+    sys.stdout.flush()
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.write(text if isinstance(text, bytes) else text.encode("utf-8"))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
 
+
+def _write_json_file(path: str, payload: Dict) -> None:
+    """
+    Serialize payload straight to a file without an intermediate string.
+    Writes go to a temp file in the same directory, renamed into place on
+    success - a crash mid-write never leaves a truncated JSON file behind.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)) or ".",
+                               suffix=".tmp")
+    try:
+        if orjson is not None:
+            with open(fd, "wb", buffering=1 << 16) as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(fd, "w", buffering=1 << 16) as f:
+                json.dump(payload, f, indent=2, default=str)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the CLI parser once per process; main() reuses it."""
     parser = argparse.ArgumentParser(
         description="Nyne Deep Research - Comprehensive person intelligence",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2249,6 +2902,10 @@ Examples:
     # Raw JSON (no LLM)
     python deep_research.py --email "ceo@company.com" --json -o raw.json
 
+    # Fast path: --name + --company + --twitter (and no email/linkedin) skips
+    # the enrichment call entirely - the slowest part of the pipeline
+    python deep_research.py --name "Jane Doe" --company "Acme" --twitter "https://x.com/janedoe"
+
     # Simulation mode: how would this person respond to a question?
     python deep_research.py --email "ceo@company.com" --question "What do they think about AI replacing jobs?"
     python deep_research.py --email "ceo@company.com" --question "How would they react to a cold pitch about our startup?" -o simulation.md
@@ -2275,6 +2932,8 @@ Get your Nyne.ai API keys at: https://nyne.ai
     parser.add_argument("--company", help="Person's company (auto-extracted from enrichment)")
     parser.add_argument("--output", "-o", help="Output file path")
     parser.add_argument("--json", action="store_true", help="Output raw JSON instead of dossier")
+    parser.add_argument("--also-json", metavar="PATH",
+                        help="With dossier output, also save the raw JSON data to PATH (written concurrently)")
     parser.add_argument("--llm", choices=["gemini", "openai", "anthropic", "auto"],
                        default="auto", help="LLM for dossier (default: auto)")
     parser.add_argument("--backup-llm", choices=["gemini", "openai", "anthropic"],
@@ -2282,10 +2941,30 @@ Get your Nyne.ai API keys at: https://nyne.ai
     parser.add_argument("--question", help="Simulate how this person would respond to a question (enables simulation mode)")
     parser.add_argument("--batch", help="CSV or TXT file of people — runs the same --question against each person. CSV: 'email'/'linkedin' columns. TXT: one email or LinkedIn URL per line.")
     parser.add_argument("--batch-output", help="Output directory for batch results (default: batch_results/)")
+    parser.add_argument("--refresh-dossier", action="store_true",
+                        help="Regenerate the dossier even if a cached one exists for this data")
+    parser.add_argument("--cache-ttl", type=float, metavar="HOURS",
+                        help="Cache lifetime in hours for research and LLM results (default: 24)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Skip the on-disk research cache and force fresh API calls")
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress progress output")
+    return parser
+
 
+def main():
+    # Check if setup is complete
+    if not check_setup():
+        sys.exit(1)
+
+    parser = _build_parser()
     args = parser.parse_args()
 
+    # --no-cache disables the LLM response cache along with the research cache
+    if args.no_cache:
+        set_llm_cache_enabled(False)
+    if args.cache_ttl is not None:
+        set_cache_ttl(args.cache_ttl)
+
     # Set backup LLM if provided
     if args.backup_llm:
         set_backup_llm(args.backup_llm)
@@ -2342,6 +3021,14 @@ Get your Nyne.ai API keys at: https://nyne.ai
 
         summary_rows = []
 
+        # Stream one JSON record per person as each completes - the file is
+        # tail-able mid-run and holds only one record in memory at a time
+        ndjson_f = open(os.path.join(batch_dir, "_results.ndjson"), "w")
+
+        def _stream_record(record):
+            ndjson_f.write(_json_dumps(record, indent=False) + "\n")
+            ndjson_f.flush()
+
         for i, row in enumerate(rows):
             email = row.get("email", "").strip() or None
             linkedin = row.get("linkedin", "").strip() or None
@@ -2349,6 +3036,12 @@ Get your Nyne.ai API keys at: https://nyne.ai
             if not email and not linkedin:
                 print(f"\n[{i+1}/{len(rows)}] ⚠ Skipping row — no email or linkedin")
                 continue
+            if email and not _EMAIL_RE.match(email):
+                print(f"\n[{i+1}/{len(rows)}] ⚠ Skipping row — invalid email: {email}")
+                continue
+            if linkedin and not _LINKEDIN_RE.match(linkedin):
+                print(f"\n[{i+1}/{len(rows)}] ⚠ Skipping row — invalid LinkedIn URL: {linkedin}")
+                continue
 
             identifier = email or linkedin
             print(f"\n[{i+1}/{len(rows)}] Researching: {identifier}")
@@ -2400,6 +3093,7 @@ Get your Nyne.ai API keys at: https://nyne.ai
                     "short_answer": short_answer,
                     "file": filename
                 })
+                _stream_record(summary_rows[-1])
 
                 print(f"  ✓ {person_name} → {sentiment}")
 
@@ -2413,6 +3107,9 @@ Get your Nyne.ai API keys at: https://nyne.ai
                     "short_answer": str(e),
                     "file": ""
                 })
+                _stream_record(summary_rows[-1])
+
+        ndjson_f.close()
 
         # Write summary CSV
         summary_path = os.path.join(batch_dir, "_summary.csv")
@@ -2442,39 +3139,109 @@ Get your Nyne.ai API keys at: https://nyne.ai
         return
 
     # ---- SINGLE PERSON MODE ----
-    if not args.email and not args.linkedin:
-        parser.error("At least --email or --linkedin is required (or use --batch for batch mode)")
-
-    input_data = ResearchInput(
+    fast_path = args.name and args.company and args.twitter
+    if not args.email and not args.linkedin and not fast_path:
+        parser.error("At least --email or --linkedin is required "
+                     "(or --name + --company + --twitter, or use --batch for batch mode)")
+    if args.email and not _EMAIL_RE.match(args.email):
+        parser.error(f"invalid email address: {args.email}")
+    if args.linkedin and not _LINKEDIN_RE.match(args.linkedin):
+        parser.error(f"invalid LinkedIn profile URL: {args.linkedin}")
+
+    # Everything below routes through research_person - one code path for
+    # CLI and programmatic use
+    also_json_future = None
+
+    def _on_data(data):
+        # --also-json overlaps the raw-data dump with dossier generation: the
+        # serialization + disk write runs on a pool thread while the LLM works
+        nonlocal also_json_future
+        if args.also_json:
+            also_json_future = _EXECUTOR.submit(
+                _write_json_file, args.also_json, _drop_empty(data))
+
+    person_kwargs = dict(
         email=args.email,
         linkedin_url=args.linkedin,
         twitter_url=args.twitter,
         instagram_url=args.instagram,
         name=args.name,
-        company=args.company
+        company=args.company,
+        llm=args.llm,
+        verbose=not args.quiet,
+        question=args.question,
+        use_cache=not args.no_cache,
+        refresh_dossier=args.refresh_dossier,
+        on_data=_on_data
     )
 
-    results = deep_research(input_data, verbose=not args.quiet)
-
     if args.json:
-        output = json.dumps({
-            "enrichment": results.enrichment,
-            "following_twitter": results.following_twitter,
-            "following_instagram": results.following_instagram,
-            "articles": results.articles
-        }, indent=2, default=str)
-    else:
-        output = generate_dossier(results, llm=args.llm, verbose=not args.quiet, question=args.question)
-        if not output:
-            output = "# No dossier generated\n\nEither no data was found or no LLM API key is configured."
+        # Most people lack one or more socials - omit empty sections rather
+        # than shipping null/[] padding through pipes and onto disk
+        raw_payload = _drop_empty(
+            research_person(generate_dossier_flag=False, **person_kwargs)["data"])
+        if args.output:
+            _write_json_file(args.output, raw_payload)
+            if not args.quiet:
+                print(f"\nSaved to: {args.output}")
+        else:
+            # orjson already produces bytes; hand them to stdout unencoded
+            _print_large(orjson.dumps(raw_payload, option=orjson.OPT_INDENT_2, default=str)
+                         if orjson is not None else _json_dumps(raw_payload))
+        # --also-json fires from _on_data even here; join it before returning
+        # so completion doesn't ride on the interpreter's exit-time pool join
+        if also_json_future is not None:
+            also_json_future.result()
+            if not args.quiet:
+                print(f"Raw JSON saved to: {args.also_json}")
+        return
 
     if args.output:
-        with open(args.output, "w") as f:
-            f.write(output)
+        # Stream dossier chunks into a temp file as the LLM produces them,
+        # renamed over the target only once complete - an interrupted run
+        # never clobbers a previous dossier with a truncated one. A 1 MB
+        # buffer batches the many small streamed chunks into few syscalls
+        fd, tmp = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(args.output)) or ".", suffix=".tmp")
+        try:
+            with open(fd, "w", buffering=1 << 20) as f:
+                written = 0
+
+                def _stream_write(chunk: str):
+                    nonlocal written
+                    f.write(chunk)
+                    written += len(chunk)
+
+                result = research_person(write=_stream_write, **person_kwargs)
+                output = result.get("simulation") or result.get("dossier")
+                if not output:
+                    output = "# No dossier generated\n\nEither no data was found or no LLM API key is configured."
+                if written != len(output):
+                    # A mid-stream provider fallback can leave stale partial chunks
+                    # in the file - rewrite it from the authoritative final string
+                    f.seek(0)
+                    f.truncate()
+                    f.write(output)
+            os.replace(tmp, args.output)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
         if not args.quiet:
             print(f"\nSaved to: {args.output}")
     else:
-        print("\n" + output)
+        result = research_person(**person_kwargs)
+        output = result.get("simulation") or result.get("dossier")
+        if not output:
+            output = "# No dossier generated\n\nEither no data was found or no LLM API key is configured."
+        _print_large(output)
+
+    if also_json_future is not None:
+        also_json_future.result()
+        if not args.quiet:
+            print(f"Raw JSON saved to: {args.also_json}")
 
 
 # ============================================================================
@@ -2491,10 +3258,22 @@ def research_person(
     generate_dossier_flag: bool = True,
     llm: str = "auto",
     verbose: bool = False,
-    question: str = None
+    question: str = None,
+    use_cache: bool = True,
+    refresh_dossier: bool = False,
+    write=None,
+    on_data=None,
+    executor=None
 ) -> Dict[str, Any]:
     """
-    Programmatic API for deep research.
+    Programmatic API for deep research. main() routes through this too, so
+    there is a single research->dossier code path.
+
+    write (optional) streams dossier chunks as they arrive (see
+    generate_dossier); on_data (optional) is called with the raw data dict
+    as soon as research finishes, before any LLM work starts; executor
+    (optional) supplies a private pool for this call's sub-tasks instead of
+    the shared module executor.
 
     Example:
         from deep_research import research_person
@@ -2514,19 +3293,20 @@ def research_person(
         company=company
     )
 
-    results = deep_research(input_data, verbose=verbose)
+    results = deep_research(input_data, verbose=verbose, use_cache=use_cache,
+                            executor=executor)
 
-    output = {
-        "data": {
-            "enrichment": results.enrichment,
-            "following_twitter": results.following_twitter,
-            "following_instagram": results.following_instagram,
-            "articles": results.articles
-        }
-    }
+    data = asdict(results)
+    data.pop("errors", None)
+    output = {"data": data}
+    if on_data:
+        on_data(data)
 
     if generate_dossier_flag:
-        result = generate_dossier(results, llm=llm, verbose=verbose, question=question)
+        result = generate_dossier(results, llm=llm, verbose=verbose, question=question,
+                                  write=write,
+                                  use_cache=use_cache, refresh=refresh_dossier,
+                                  executor=executor)
         if question:
             output["simulation"] = result
         else:
@@ -2535,5 +3315,44 @@ def research_person(
     return output
 
 
+def research_people(people: list, max_concurrent: int = 10, **kwargs) -> list:
+    """
+    Research several people concurrently.
+
+    Each entry in people is a dict of research_person keyword arguments
+    (e.g. {"email": ...} or {"linkedin_url": ...}); shared options like
+    llm= or question= can be passed once via **kwargs. Results come back
+    in input order; a failed person yields {"error": ...} instead of
+    aborting the batch.
+
+    Example:
+        results = research_people(
+            [{"email": "a@x.com"}, {"linkedin_url": "https://linkedin.com/in/b"}],
+            question="What do they think about AI?"
+        )
+
+    Concurrency is bounded by max_concurrent (default 10) to stay inside
+    provider rate limits. Each person also gets a private sub-task pool for
+    their polls and LLM batch calls, so one person's long-polls never queue
+    behind a sibling's in the shared module executor.
+    """
+    results = [None] * len(people)
+
+    def _one(person):
+        with ThreadPoolExecutor(max_workers=8) as sub:
+            return research_person(executor=sub, **{**kwargs, **person})
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrent)) as pool:
+        futures = {pool.submit(_one, person): i
+                   for i, person in enumerate(people)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = {"error": str(e)}
+    return results
+
+
 if __name__ == "__main__":
     main()